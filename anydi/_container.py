@@ -6,9 +6,9 @@ import contextlib
 import inspect
 import types
 from collections import defaultdict
-from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator, Sequence
+from collections.abc import Awaitable, Iterable, Iterator, Sequence
 from contextvars import ContextVar
-from typing import Any, Callable, TypeVar, cast, overload
+from typing import Any, Callable, Final, TypeVar, overload
 
 from typing_extensions import ParamSpec, Self, final
 
@@ -29,10 +29,12 @@ from ._utils import get_full_qualname, get_typed_parameters, is_builtin_type
 T = TypeVar("T", bound=Any)
 P = ParamSpec("P")
 
-ALLOWED_SCOPES: dict[Scope, list[Scope]] = {
-    "singleton": ["singleton"],
-    "request": ["request", "singleton"],
-    "transient": ["transient", "singleton", "request"],
+_sentinel = object()
+
+ALLOWED_SCOPES: Final[dict[Scope, frozenset[Scope]]] = {
+    "singleton": frozenset({"singleton"}),
+    "request": frozenset({"request", "singleton"}),
+    "transient": frozenset({"transient", "singleton", "request"}),
 }
 
 
@@ -50,8 +52,13 @@ class Container:
     ) -> None:
         self._providers: dict[type[Any], Provider] = {}
         self._resource_cache: dict[Scope, list[type[Any]]] = defaultdict(list)
+        self._event_cache: dict[Scope, list[type[Any]]] = defaultdict(list)
         self._singleton_context = SingletonContext(self)
         self._transient_context = TransientContext(self)
+        self._scoped_contexts: dict[Scope, ScopedContext] = {
+            "singleton": self._singleton_context,
+            "transient": self._transient_context,
+        }
         self._request_context_var: ContextVar[RequestContext | None] = ContextVar(
             "request_context", default=None
         )
@@ -142,14 +149,14 @@ class Container:
 
     def _get_provider(self, interface: AnyInterface) -> Provider:
         """Get provider by interface."""
-        try:
-            return self._providers[interface]
-        except KeyError as exc:
+        provider = self._providers.get(interface)
+        if provider is None:
             raise LookupError(
                 f"The provider interface for `{get_full_qualname(interface)}` has "
                 "not been registered. Please ensure that the provider interface is "
                 "properly registered before attempting to use it."
-            ) from exc
+            )
+        return provider
 
     def _get_or_register_provider(
         self, interface: AnyInterface, parent_scope: Scope | None = None
@@ -177,6 +184,8 @@ class Container:
         self._providers[provider.interface] = provider
         if provider.is_resource:
             self._resource_cache[provider.scope].append(provider.interface)
+            if provider.is_event:
+                self._event_cache[provider.scope].append(provider.interface)
 
     def _delete_provider(self, provider: Provider) -> None:
         """Delete a provider."""
@@ -184,6 +193,8 @@ class Container:
             del self._providers[provider.interface]
         if provider.is_resource:
             self._resource_cache[provider.scope].remove(provider.interface)
+            if provider.is_event:
+                self._event_cache[provider.scope].remove(provider.interface)
 
     def _validate_sub_providers(self, provider: Provider) -> None:
         """Validate the sub-providers of a provider."""
@@ -191,12 +202,6 @@ class Container:
         for parameter in provider.parameters:
             annotation = parameter.annotation
 
-            if annotation is inspect.Parameter.empty:
-                raise TypeError(
-                    f"Missing provider `{provider}` "
-                    f"dependency `{parameter.name}` annotation."
-                )
-
             try:
                 sub_provider = self._get_or_register_provider(
                     annotation, parent_scope=provider.scope
@@ -213,7 +218,7 @@ class Container:
                 ) from None
 
             # Check scope compatibility
-            if sub_provider.scope not in ALLOWED_SCOPES.get(provider.scope, []):
+            if sub_provider.scope not in ALLOWED_SCOPES[provider.scope]:
                 raise ValueError(
                     f"The provider `{provider}` with a `{provider.scope}` scope cannot "
                     f"depend on `{sub_provider}` with a `{sub_provider.scope}` scope. "
@@ -260,7 +265,7 @@ class Container:
         exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
         exc_tb: types.TracebackType | None,
-    ) -> bool:
+    ) -> bool | None:
         """Exit the singleton context."""
         return self._singleton_context.__exit__(exc_type, exc_val, exc_tb)
 
@@ -272,14 +277,9 @@ class Container:
         """Close the singleton context."""
         self._singleton_context.close()
 
-    @contextlib.contextmanager
-    def request_context(self) -> Iterator[RequestContext]:
+    def request_context(self) -> RequestContext:
         """Obtain a context manager for the request-scoped context."""
-        context = RequestContext(self)
-        token = self._request_context_var.set(context)
-        with context:
-            yield context
-            self._request_context_var.reset(token)
+        return RequestContext(self)
 
     async def __aenter__(self) -> Self:
         """Enter the singleton context."""
@@ -291,7 +291,7 @@ class Container:
         exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
         exc_tb: types.TracebackType | None,
-    ) -> bool:
+    ) -> bool | None:
         """Exit the singleton context."""
         return await self._singleton_context.__aexit__(exc_type, exc_val, exc_tb)
 
@@ -303,14 +303,9 @@ class Container:
         """Close the singleton context asynchronously."""
         await self._singleton_context.aclose()
 
-    @contextlib.asynccontextmanager
-    async def arequest_context(self) -> AsyncIterator[RequestContext]:
+    def arequest_context(self) -> RequestContext:
         """Obtain an async context manager for the request-scoped context."""
-        context = RequestContext(self)
-        token = self._request_context_var.set(context)
-        async with context:
-            yield context
-            self._request_context_var.reset(token)
+        return RequestContext(self, is_async=True)
 
     def _get_request_context(self) -> RequestContext:
         """Get the current request context."""
@@ -341,12 +336,17 @@ class Container:
 
     def resolve(self, interface: Interface[T]) -> T:
         """Resolve an instance by interface."""
-        if interface in self._override_instances:
-            return cast(T, self._override_instances[interface])
-
-        provider = self._get_or_register_provider(interface)
+        # Overrides are rarely active, skip the lookup while there are none
+        if self._override_instances:
+            instance = self._override_instances.get(interface, _sentinel)
+            if instance is not _sentinel:
+                return instance  # type: ignore[no-any-return]
+
+        provider = self._providers.get(interface) or self._get_or_register_provider(
+            interface
+        )
         scoped_context = self._get_scoped_context(provider.scope)
-        return cast(T, scoped_context.get(provider))
+        return scoped_context.get(provider)  # type: ignore[no-any-return]
 
     @overload
     async def aresolve(self, interface: Interface[T]) -> T: ...
@@ -356,12 +356,17 @@ class Container:
 
     async def aresolve(self, interface: Interface[T]) -> T:
         """Resolve an instance by interface asynchronously."""
-        if interface in self._override_instances:
-            return cast(T, self._override_instances[interface])
-
-        provider = self._get_or_register_provider(interface)
+        # Overrides are rarely active, skip the lookup while there are none
+        if self._override_instances:
+            instance = self._override_instances.get(interface, _sentinel)
+            if instance is not _sentinel:
+                return instance  # type: ignore[no-any-return]
+
+        provider = self._providers.get(interface) or self._get_or_register_provider(
+            interface
+        )
         scoped_context = self._get_scoped_context(provider.scope)
-        return cast(T, await scoped_context.aget(provider))
+        return await scoped_context.aget(provider)  # type: ignore[no-any-return]
 
     def is_resolved(self, interface: AnyInterface) -> bool:
         """Check if an instance by interface exists."""
@@ -384,12 +389,11 @@ class Container:
 
     def _get_scoped_context(self, scope: Scope) -> ScopedContext:
         """Get the scoped context based on the specified scope."""
-        if scope == "singleton":
-            return self._singleton_context
-        elif scope == "request":
-            request_context = self._get_request_context()
-            return request_context
-        return self._transient_context
+        scoped_context = self._scoped_contexts.get(scope)
+        if scoped_context is None:
+            # The request context is bound to the current execution context
+            return self._get_request_context()
+        return scoped_context
 
     @contextlib.contextmanager
     def override(self, interface: AnyInterface, instance: Any) -> Iterator[None]:
@@ -442,7 +446,7 @@ class Container:
 
     def run(self, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
         """Run the given function with injected dependencies."""
-        return cast(T, self._injector.inject(func)(*args, **kwargs))
+        return self._injector.inject(func)(*args, **kwargs)  # type: ignore[return-value]
 
     def scan(
         self,
@@ -2,23 +2,29 @@ from __future__ import annotations
 
 import abc
 import contextlib
+import functools
 import inspect
+from contextvars import Token
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Callable, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar, cast
 
 from typing_extensions import Self, final
 
-from ._provider import CallableKind, Provider
-from ._types import AnyInterface, Scope, is_event_type
+from ._provider import Provider
+from ._types import AnyInterface, Scope
 from ._utils import get_full_qualname, run_async
 
 if TYPE_CHECKING:
     from ._container import Container
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 class ScopedContext(abc.ABC):
     """ScopedContext base class."""
 
+    __slots__ = ("container", "_instances")
+
     scope: ClassVar[Scope]
 
     def __init__(self, container: Container) -> None:
@@ -39,32 +45,43 @@ class ScopedContext(abc.ABC):
 
     def _create_instance(self, provider: Provider) -> Any:
         """Create an instance using the provider."""
-        if provider.kind == CallableKind.COROUTINE:
+        if provider.is_coroutine:
             raise TypeError(
                 f"The instance for the coroutine provider `{provider}` cannot be "
                 "created in synchronous mode."
             )
+        # Providers without parameters are called directly
+        if not provider.parameters:
+            return provider.call()
         args, kwargs = self._get_provider_params(provider)
         return provider.call(*args, **kwargs)
 
     async def _acreate_instance(self, provider: Provider) -> Any:
         """Create an instance asynchronously using the provider."""
+        if provider.is_coroutine and not provider.parameters:
+            return await provider.call()
         args, kwargs = await self._aget_provider_params(provider)
-        if provider.kind == CallableKind.COROUTINE:
+        if provider.is_coroutine:
             return await provider.call(*args, **kwargs)
         return await run_async(provider.call, *args, **kwargs)
 
     def _resolve_parameter(
         self, provider: Provider, parameter: inspect.Parameter
     ) -> Any:
-        self._validate_resolvable_parameter(parameter, call=provider.call)
-        return self.container.resolve(parameter.annotation)
+        container = self.container
+        # Nothing to validate until an interface is marked as unresolved
+        if container._unresolved_interfaces:  # noqa
+            self._validate_resolvable_parameter(parameter, call=provider.call)
+        return container.resolve(parameter.annotation)
 
     async def _aresolve_parameter(
         self, provider: Provider, parameter: inspect.Parameter
     ) -> Any:
-        self._validate_resolvable_parameter(parameter, call=provider.call)
-        return await self.container.aresolve(parameter.annotation)
+        container = self.container
+        # Nothing to validate until an interface is marked as unresolved
+        if container._unresolved_interfaces:  # noqa
+            self._validate_resolvable_parameter(parameter, call=provider.call)
+        return await container.aresolve(parameter.annotation)
 
     def _validate_resolvable_parameter(
         self, parameter: inspect.Parameter, call: Callable[..., Any]
@@ -82,80 +99,107 @@ class ScopedContext(abc.ABC):
         self, provider: Provider
     ) -> tuple[list[Any], dict[str, Any]]:
         """Retrieve the arguments for a provider."""
+        override_instances = self.container._override_instances  # noqa
+        instances = self._instances
         args: list[Any] = []
         kwargs: dict[str, Any] = {}
 
-        for parameter in provider.parameters:
-            if parameter.annotation in self.container._override_instances:  # noqa
-                instance = self.container._override_instances[parameter.annotation]  # noqa
-            elif parameter.annotation in self._instances:
-                instance = self._instances[parameter.annotation]
+        for parameter in provider.positional_parameters:
+            annotation = parameter.annotation
+            if override_instances and annotation in override_instances:
+                args.append(override_instances[annotation])
+            elif annotation in instances:
+                args.append(instances[annotation])
             else:
-                instance = self._resolve_parameter(provider, parameter)
-            if parameter.kind == parameter.POSITIONAL_ONLY:
-                args.append(instance)
+                args.append(self._resolve_parameter(provider, parameter))
+        for parameter in provider.keyword_parameters:
+            annotation = parameter.annotation
+            if override_instances and annotation in override_instances:
+                kwargs[parameter.name] = override_instances[annotation]
+            elif annotation in instances:
+                kwargs[parameter.name] = instances[annotation]
             else:
-                kwargs[parameter.name] = instance
+                kwargs[parameter.name] = self._resolve_parameter(provider, parameter)
         return args, kwargs
 
     async def _aget_provider_params(
         self, provider: Provider
     ) -> tuple[list[Any], dict[str, Any]]:
         """Asynchronously retrieve the arguments for a provider."""
+        override_instances = self.container._override_instances  # noqa
+        instances = self._instances
         args: list[Any] = []
         kwargs: dict[str, Any] = {}
 
-        for parameter in provider.parameters:
-            if parameter.annotation in self.container._override_instances:  # noqa
-                instance = self.container._override_instances[parameter.annotation]  # noqa
-            elif parameter.annotation in self._instances:
-                instance = self._instances[parameter.annotation]
+        for parameter in provider.positional_parameters:
+            annotation = parameter.annotation
+            if override_instances and annotation in override_instances:
+                args.append(override_instances[annotation])
+            elif annotation in instances:
+                args.append(instances[annotation])
             else:
-                instance = await self._aresolve_parameter(provider, parameter)
-            if parameter.kind == parameter.POSITIONAL_ONLY:
-                args.append(instance)
+                args.append(await self._aresolve_parameter(provider, parameter))
+        for parameter in provider.keyword_parameters:
+            annotation = parameter.annotation
+            if override_instances and annotation in override_instances:
+                kwargs[parameter.name] = override_instances[annotation]
+            elif annotation in instances:
+                kwargs[parameter.name] = instances[annotation]
             else:
-                kwargs[parameter.name] = instance
+                kwargs[parameter.name] = await self._aresolve_parameter(
+                    provider, parameter
+                )
         return args, kwargs
 
 
 class ResourceScopedContext(ScopedContext):
     """ScopedContext with closable resources support."""
 
+    __slots__ = ("_stack", "_async_stack")
+
     def __init__(self, container: Container) -> None:
         """Initialize the ScopedContext."""
         super().__init__(container)
-        self._stack = contextlib.ExitStack()
-        self._async_stack = contextlib.AsyncExitStack()
+        # Exit stacks are created on first use, most requests never need them
+        self._stack: contextlib.ExitStack | None = None
+        self._async_stack: contextlib.AsyncExitStack | None = None
 
     def get(self, provider: Provider) -> Any:
         """Get an instance of a dependency from the scoped context."""
-        instance = self._instances.get(provider.interface)
-        if instance is None:
-            if provider.kind == CallableKind.GENERATOR:
-                instance = self._create_resource(provider)
-            elif provider.kind == CallableKind.ASYNC_GENERATOR:
-                raise TypeError(
-                    f"The provider `{provider}` cannot be started in synchronous mode "
-                    "because it is an asynchronous provider. Please start the provider "
-                    "in asynchronous mode before using it."
-                )
-            else:
-                instance = self._create_instance(provider)
-            self._instances[provider.interface] = instance
+        instances, interface = self._instances, provider.interface
+        try:
+            return instances[interface]
+        except KeyError:
+            pass
+        if provider.is_generator:
+            instance = self._create_resource(provider)
+        elif provider.is_async_generator:
+            raise TypeError(
+                f"The provider `{provider}` cannot be started in synchronous mode "
+                "because it is an asynchronous provider. Please start the provider "
+                "in asynchronous mode before using it."
+            )
+        else:
+            instance = self._create_instance(provider)
+        instances[interface] = instance
         return instance
 
     async def aget(self, provider: Provider) -> Any:
         """Get an async instance of a dependency from the scoped context."""
-        instance = self._instances.get(provider.interface)
-        if instance is None:
-            if provider.kind == CallableKind.GENERATOR:
-                instance = await run_async(self._create_resource, provider)
-            elif provider.kind == CallableKind.ASYNC_GENERATOR:
-                instance = await self._acreate_resource(provider)
-            else:
-                instance = await self._acreate_instance(provider)
-            self._instances[provider.interface] = instance
+        instances, interface = self._instances, provider.interface
+        try:
+            return instances[interface]
+        except KeyError:
+            pass
+        if provider.is_generator:
+            # Create the stack on the event loop, not in the worker thread
+            self._get_stack()
+            instance = await run_async(self._create_resource, provider)
+        elif provider.is_async_generator:
+            instance = await self._acreate_resource(provider)
+        else:
+            instance = await self._acreate_instance(provider)
+        instances[interface] = instance
         return instance
 
     def has(self, interface: AnyInterface) -> bool:
@@ -167,28 +211,44 @@ class ResourceScopedContext(ScopedContext):
         instance = super()._create_instance(provider)
         # Enter the context manager if the instance is closable.
         if hasattr(instance, "__enter__") and hasattr(instance, "__exit__"):
-            self._stack.enter_context(instance)
+            self._get_stack().enter_context(instance)
         return instance
 
     def _create_resource(self, provider: Provider) -> Any:
         """Create a resource using the provider."""
         args, kwargs = self._get_provider_params(provider)
-        cm = contextlib.contextmanager(provider.call)(*args, **kwargs)
-        return self._stack.enter_context(cm)
+        factory = provider.resource_factory
+        assert factory is not None
+        cm = factory(*args, **kwargs)
+        return self._get_stack().enter_context(cm)
 
     async def _acreate_instance(self, provider: Provider) -> Any:
         """Create an instance asynchronously using the provider."""
         instance = await super()._acreate_instance(provider)
         # Enter the context manager if the instance is closable.
         if hasattr(instance, "__aenter__") and hasattr(instance, "__aexit__"):
-            await self._async_stack.enter_async_context(instance)
+            await self._get_async_stack().enter_async_context(instance)
         return instance
 
     async def _acreate_resource(self, provider: Provider) -> Any:
         """Create a resource asynchronously using the provider."""
         args, kwargs = await self._aget_provider_params(provider)
-        cm = contextlib.asynccontextmanager(provider.call)(*args, **kwargs)
-        return await self._async_stack.enter_async_context(cm)
+        factory = provider.resource_factory
+        assert factory is not None
+        cm = factory(*args, **kwargs)
+        return await self._get_async_stack().enter_async_context(cm)
+
+    def _get_stack(self) -> contextlib.ExitStack:
+        """Get the exit stack, creating it on first use."""
+        if self._stack is None:
+            self._stack = contextlib.ExitStack()
+        return self._stack
+
+    def _get_async_stack(self) -> contextlib.AsyncExitStack:
+        """Get the async exit stack, creating it on first use."""
+        if self._async_stack is None:
+            self._async_stack = contextlib.AsyncExitStack()
+        return self._async_stack
 
     def delete(self, interface: AnyInterface) -> None:
         """Delete a dependency instance from the scoped context."""
@@ -204,9 +264,11 @@ class ResourceScopedContext(ScopedContext):
         exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
-    ) -> bool:
+    ) -> bool | None:
         """Exit the context."""
-        return self._stack.__exit__(exc_type, exc_val, exc_tb)  # type: ignore[return-value]
+        if self._stack is None:
+            return None
+        return self._stack.__exit__(exc_type, exc_val, exc_tb)
 
     @abc.abstractmethod
     def start(self) -> None:
@@ -216,7 +278,8 @@ class ResourceScopedContext(ScopedContext):
 
     def close(self) -> None:
         """Close the scoped context."""
-        self._stack.__exit__(None, None, None)
+        if self._stack is not None:
+            self._stack.__exit__(None, None, None)
 
     async def __aenter__(self) -> Self:
         """Enter the context asynchronously."""
@@ -228,11 +291,17 @@ class ResourceScopedContext(ScopedContext):
         exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
-    ) -> bool:
+    ) -> bool | None:
         """Exit the context asynchronously."""
-        return await run_async(
-            self.__exit__, exc_type, exc_val, exc_tb
-        ) or await self._async_stack.__aexit__(exc_type, exc_val, exc_tb)
+        if self._stack is not None:
+            suppressed = await run_async(
+                self._stack.__exit__, exc_type, exc_val, exc_tb
+            )
+            if suppressed:
+                return suppressed
+        if self._async_stack is None:
+            return None
+        return await self._async_stack.__aexit__(exc_type, exc_val, exc_tb)
 
     @abc.abstractmethod
     async def astart(self) -> None:
@@ -247,37 +316,135 @@ class ResourceScopedContext(ScopedContext):
 class SingletonContext(ResourceScopedContext):
     """A scoped context representing the "singleton" scope."""
 
+    __slots__ = ()
+
     scope = "singleton"
 
+    def __init__(self, container: Container) -> None:
+        """Initialize the SingletonContext."""
+        super().__init__(container)
+        # Singletons may be resolved from several threads, so create the
+        # stacks upfront rather than racing to create them on first use
+        self._stack = contextlib.ExitStack()
+        self._async_stack = contextlib.AsyncExitStack()
+
     def start(self) -> None:
         """Start the scoped context."""
-        for interface in self.container._resource_cache.get(self.scope, []):  # noqa
-            self.container.resolve(interface)
+        for provider in self._get_resource_providers():
+            self.get(provider)
 
     async def astart(self) -> None:
         """Start the scoped context asynchronously."""
-        for interface in self.container._resource_cache.get(self.scope, []):  # noqa
-            await self.container.aresolve(interface)
+        for provider in self._get_resource_providers():
+            await self.aget(provider)
+
+    def _get_resource_providers(self) -> list[Provider]:
+        """Get the singleton resource providers that are not overridden."""
+        # All of them belong to this context, so skip the resolve dispatch
+        providers = self.container._providers  # noqa
+        override_instances = self.container._override_instances  # noqa
+        return [
+            providers[interface]
+            for interface in self.container._resource_cache.get(self.scope, [])  # noqa
+            if interface not in override_instances
+        ]
 
 
 @final
 class RequestContext(ResourceScopedContext):
     """A scoped context representing the "request" scope."""
 
+    __slots__ = ("_token", "_is_async")
+
     scope = "request"
 
+    def __init__(self, container: Container, *, is_async: bool = False) -> None:
+        """Initialize the RequestContext."""
+        super().__init__(container)
+        self._token: Token[RequestContext | None] | None = None
+        self._is_async = is_async
+
+    def __call__(self, func: F) -> F:
+        """Run each call of the decorated function in a new request context."""
+        container = self.container
+
+        if self._is_async:
+
+            @functools.wraps(func)
+            async def awrapper(*args: Any, **kwargs: Any) -> Any:
+                async with RequestContext(container, is_async=True):
+                    return await func(*args, **kwargs)
+
+            return cast(F, awrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with RequestContext(container):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    def __enter__(self) -> Self:
+        """Enter the context and set it as current."""
+        if self._is_async:
+            raise TypeError(
+                "The asynchronous request context must be entered with `async with`."
+            )
+        self._token = self.container._request_context_var.set(self)  # noqa
+        # Most requests have no event resources to start
+        if self.container._event_cache.get(self.scope):  # noqa
+            self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        """Exit the context and reset the current context."""
+        try:
+            return super().__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._reset_token()
+
+    async def __aenter__(self) -> Self:
+        """Enter the context asynchronously and set it as current."""
+        if not self._is_async:
+            raise TypeError(
+                "The synchronous request context must be entered with `with`."
+            )
+        self._token = self.container._request_context_var.set(self)  # noqa
+        if self.container._event_cache.get(self.scope):  # noqa
+            await self.astart()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        """Exit the context asynchronously and reset the current context."""
+        try:
+            return await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._reset_token()
+
+    def _reset_token(self) -> None:
+        """Restore the previous request context."""
+        if self._token is not None:
+            self.container._request_context_var.reset(self._token)  # noqa
+            self._token = None
+
     def start(self) -> None:
         """Start the scoped context."""
-        for interface in self.container._resource_cache.get(self.scope, []):  # noqa
-            if not is_event_type(interface):
-                continue
+        for interface in self.container._event_cache.get(self.scope, []):  # noqa
             self.container.resolve(interface)
 
     async def astart(self) -> None:
         """Start the scoped context asynchronously."""
-        for interface in self.container._resource_cache.get(self.scope, []):  # noqa
-            if not is_event_type(interface):
-                continue
+        for interface in self.container._event_cache.get(self.scope, []):  # noqa
             await self.container.aresolve(interface)
 
 
@@ -285,6 +452,8 @@ class RequestContext(ResourceScopedContext):
 class TransientContext(ScopedContext):
     """A scoped context representing the "transient" scope."""
 
+    __slots__ = ()
+
     scope = "transient"
 
     def get(self, provider: Provider) -> Any:
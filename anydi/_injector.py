@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import inspect
+import logging
+import weakref
 from collections.abc import Awaitable
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, Union, cast
@@ -9,7 +11,12 @@ from typing_extensions import ParamSpec
 
 from ._logger import logger
 from ._types import is_marker
-from ._utils import get_full_qualname, get_typed_parameters
+from ._utils import (
+    get_full_qualname,
+    get_typed_parameters,
+    weak_cache_get,
+    weak_cache_set,
+)
 
 if TYPE_CHECKING:
     from ._container import Container
@@ -20,26 +27,34 @@ P = ParamSpec("P")
 
 
 class Injector:
+    __slots__ = ("container", "_injected_params_cache")
+
     def __init__(self, container: Container) -> None:
         self.container = container
+        self._injected_params_cache: weakref.WeakKeyDictionary[
+            Callable[..., Any], dict[str, Any]
+        ] = weakref.WeakKeyDictionary()
 
     def inject(
         self,
         call: Callable[P, T | Awaitable[T]],
     ) -> Callable[P, T | Awaitable[T]]:
         # Check if the inner callable has already been wrapped
-        if hasattr(call, "__inject_wrapper__"):
-            return cast(Callable[P, Union[T, Awaitable[T]]], call.__inject_wrapper__)
+        inject_wrapper = getattr(call, "__inject_wrapper__", None)
+        if inject_wrapper is not None:
+            return cast(Callable[P, Union[T, Awaitable[T]]], inject_wrapper)
 
-        injected_params = self._get_injected_params(call)
+        injected_params = tuple(self._get_injected_params(call).items())
+        # Resolve methods are looked up per call, extensions may patch them
+        container = self.container
 
         if inspect.iscoroutinefunction(call):
 
             @wraps(call)
             async def awrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-                for name, annotation in injected_params.items():
-                    kwargs[name] = await self.container.aresolve(annotation)
-                return cast(T, await call(*args, **kwargs))
+                for name, annotation in injected_params:
+                    kwargs[name] = await container.aresolve(annotation)
+                return await call(*args, **kwargs)  # type: ignore[no-any-return]
 
             call.__inject_wrapper__ = awrapper  # type: ignore[attr-defined]
 
@@ -47,9 +62,9 @@ class Injector:
 
         @wraps(call)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            for name, annotation in injected_params.items():
-                kwargs[name] = self.container.resolve(annotation)
-            return cast(T, call(*args, **kwargs))
+            for name, annotation in injected_params:
+                kwargs[name] = container.resolve(annotation)
+            return call(*args, **kwargs)  # type: ignore[return-value]
 
         # check if the call is a method
         if inspect.ismethod(call):
@@ -61,23 +76,40 @@ class Injector:
 
     def _get_injected_params(self, call: Callable[..., Any]) -> dict[str, Any]:
         """Get the injected parameters of a callable object."""
+        # Bound methods are created on every attribute access, so cache them
+        # by the underlying function, which has the same injected parameters
+        key = getattr(call, "__func__", call)
+        cached_params = weak_cache_get(self._injected_params_cache, key)
+        if cached_params is not None:
+            return cached_params
+
         injected_params = {}
+        providers = self.container._providers  # noqa
         for parameter in get_typed_parameters(call):
             if not is_marker(parameter.default):
                 continue
+            # Registered annotations are valid, only validate the rest
+            if parameter.annotation in providers:
+                injected_params[parameter.name] = parameter.annotation
+                continue
             try:
                 self._validate_injected_parameter(call, parameter)
             except LookupError as exc:
                 if not self.container.strict:
-                    logger.debug(
-                        f"Cannot validate the `{get_full_qualname(call)}` parameter "
-                        f"`{parameter.name}` with an annotation of "
-                        f"`{get_full_qualname(parameter.annotation)} due to being "
-                        "in non-strict mode. It will be validated at the first call."
-                    )
+                    # Avoid formatting the qualnames when debug logging is off
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"Cannot validate the `{get_full_qualname(call)}` "
+                            f"parameter `{parameter.name}` with an annotation of "
+                            f"`{get_full_qualname(parameter.annotation)} due to being "
+                            "in non-strict mode. It will be validated at the first "
+                            "call."
+                        )
                 else:
                     raise exc
             injected_params[parameter.name] = parameter.annotation
+
+        weak_cache_set(self._injected_params_cache, key, injected_params)
         return injected_params
 
     def _validate_injected_parameter(
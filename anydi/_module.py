@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from typing_extensions import Concatenate, NamedTuple, ParamSpec
 
+from ._provider import Provider
 from ._types import Scope
 from ._utils import import_string
 
@@ -17,16 +18,20 @@ T = TypeVar("T")
 M = TypeVar("M", bound="Module")
 P = ParamSpec("P")
 
+_sentinel = object()
+
 
 class ModuleMeta(type):
     """A metaclass used for the Module base class."""
 
     def __new__(cls, name: str, bases: tuple[type, ...], attrs: dict[str, Any]) -> Any:
-        attrs["providers"] = [
-            (name, getattr(value, "__provider__"))
-            for name, value in attrs.items()
-            if hasattr(value, "__provider__")
-        ]
+        providers = []
+        for attr_name, value in attrs.items():
+            # Single lookup instead of hasattr followed by getattr
+            provider_args = getattr(value, "__provider__", _sentinel)
+            if provider_args is not _sentinel:
+                providers.append((attr_name, provider_args))
+        attrs["providers"] = providers
         return super().__new__(cls, name, bases, attrs)
 
 
@@ -40,6 +45,8 @@ class Module(metaclass=ModuleMeta):
 
 
 class ModuleRegistry:
+    __slots__ = ("container",)
+
     def __init__(self, container: Container) -> None:
         self.container = container
 
@@ -64,11 +71,12 @@ class ModuleRegistry:
         if isinstance(module, Module):
             module.configure(self.container)
             for provider_name, decorator_args in module.providers:
-                obj = getattr(module, provider_name)
-                self.container.provider(
-                    scope=decorator_args.scope,
-                    override=decorator_args.override,
-                )(obj)
+                provider = Provider(
+                    call=getattr(module, provider_name), scope=decorator_args.scope
+                )
+                self.container._register_provider(  # noqa
+                    provider, override=decorator_args.override
+                )
 
 
 class ProviderDecoratorArgs(NamedTuple):
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 import inspect
-import uuid
+import itertools
 from collections.abc import AsyncIterator, Iterator
 from enum import IntEnum
-from typing import Any, Callable
+from typing import Any, Callable, Final
 
 from typing_extensions import get_args, get_origin
 
@@ -14,10 +15,18 @@ except ImportError:
     NoneType = type(None)  # type: ignore[misc]
 
 
-from ._types import Event, Scope
-from ._utils import get_full_qualname, get_typed_annotation
+from ._types import Event, Scope, is_event_type
+from ._utils import (
+    get_full_qualname,
+    get_typed_parameters,
+    get_typed_return_annotation,
+)
 
 _sentinel = object()
+_event_counter = itertools.count()
+_POSITIONAL_ONLY: Final = inspect.Parameter.POSITIONAL_ONLY
+
+SCOPES: Final[tuple[Scope, ...]] = get_args(Scope)
 
 
 class CallableKind(IntEnum):
@@ -31,40 +40,50 @@ class CallableKind(IntEnum):
 class Provider:
     __slots__ = (
         "_call",
-        "_call_module",
-        "_call_globals",
         "_scope",
         "_qualname",
         "_kind",
+        "_is_coroutine",
+        "_is_generator",
+        "_is_async_generator",
+        "_is_resource",
+        "_resource_factory",
         "_interface",
+        "_is_event",
         "_parameters",
+        "_positional_parameters",
+        "_keyword_parameters",
     )
 
     def __init__(
         self, call: Callable[..., Any], *, scope: Scope, interface: Any = _sentinel
     ) -> None:
         self._call = call
-        self._call_module = getattr(call, "__module__", None)
-        self._call_globals = getattr(call, "__globals__", {})
         self._scope = scope
-        self._qualname = get_full_qualname(call)
+        # Only needed for messages, so computed on first use
+        self._qualname: str | None = None
 
         # Detect the kind of callable provider
         self._detect_kind()
+        self._is_coroutine = self._kind == CallableKind.COROUTINE
+        self._is_generator = self._kind == CallableKind.GENERATOR
+        self._is_async_generator = self._kind == CallableKind.ASYNC_GENERATOR
+        self._is_resource = self._is_generator or self._is_async_generator
+        self._resource_factory = self._create_resource_factory()
 
         # Validate the scope of the provider
         self._validate_scope()
 
-        # Get the signature
-        signature = inspect.signature(call)
-
         # Detect the interface
-        self._detect_interface(interface, signature)
+        self._detect_interface(interface)
+        self._is_event = self._is_resource and is_event_type(self._interface)
 
         # Detect the parameters
-        self._detect_parameters(signature)
+        self._detect_parameters()
 
     def __str__(self) -> str:
+        if self._qualname is None:
+            self._qualname = get_full_qualname(self._call)
         return self._qualname
 
     def __eq__(self, other: object) -> bool:
@@ -93,23 +112,63 @@ class Provider:
         return self._interface
 
     @property
-    def parameters(self) -> list[inspect.Parameter]:
+    def parameters(self) -> tuple[inspect.Parameter, ...]:
         return self._parameters
 
+    @property
+    def positional_parameters(self) -> tuple[inspect.Parameter, ...]:
+        """Get the parameters passed positionally to the callable."""
+        return self._positional_parameters
+
+    @property
+    def keyword_parameters(self) -> tuple[inspect.Parameter, ...]:
+        """Get the parameters passed by keyword to the callable."""
+        return self._keyword_parameters
+
+    @property
+    def is_coroutine(self) -> bool:
+        """Check if the provider is a coroutine function."""
+        return self._is_coroutine
+
+    @property
+    def is_generator(self) -> bool:
+        """Check if the provider is a generator function."""
+        return self._is_generator
+
+    @property
+    def is_async_generator(self) -> bool:
+        """Check if the provider is an async generator function."""
+        return self._is_async_generator
+
     @property
     def is_resource(self) -> bool:
         """Check if the provider is a resource."""
-        return self._kind in {
-            CallableKind.GENERATOR,
-            CallableKind.ASYNC_GENERATOR,
-        }
+        return self._is_resource
+
+    @property
+    def is_event(self) -> bool:
+        """Check if the provider is an event resource."""
+        return self._is_event
+
+    @property
+    def resource_factory(self) -> Callable[..., Any] | None:
+        """Get the context manager factory of a resource provider."""
+        return self._resource_factory
+
+    def _create_resource_factory(self) -> Callable[..., Any] | None:
+        """Wrap the resource provider into a context manager factory once."""
+        if self._is_generator:
+            return contextlib.contextmanager(self._call)
+        if self._is_async_generator:
+            return contextlib.asynccontextmanager(self._call)
+        return None
 
     def _validate_scope(self) -> None:
         """Validate the scope of the provider."""
-        if self.scope not in get_args(Scope):
+        if self.scope not in SCOPES:
             raise ValueError(
                 "The scope provided is invalid. Only the following scopes are "
-                f"supported: {', '.join(get_args(Scope))}. Please use one of the "
+                f"supported: {', '.join(SCOPES)}. Please use one of the "
                 "supported scopes when registering a provider."
             )
         if self.is_resource and self.scope == "transient":
@@ -136,7 +195,7 @@ class Provider:
                 "object. Only callable providers are allowed."
             )
 
-    def _detect_interface(self, interface: Any, signature: inspect.Signature) -> None:
+    def _detect_interface(self, interface: Any) -> None:
         """Detect the interface of callable provider."""
         # If the callable is a class, return the class itself
         if self._kind == CallableKind.CLASS:
@@ -144,16 +203,18 @@ class Provider:
             return
 
         if interface is _sentinel:
-            interface = self._resolve_interface(interface, signature)
+            interface = self._resolve_interface()
 
         # If the callable is an iterator, return the actual type
-        iterator_types = {Iterator, AsyncIterator}
-        if interface in iterator_types or get_origin(interface) in iterator_types:
+        origin = get_origin(interface) or interface
+        if origin is Iterator or origin is AsyncIterator:
             if args := get_args(interface):
                 interface = args[0]
                 # If the callable is a generator, return the resource type
                 if interface is NoneType or interface is None:
-                    self._interface = type(f"Event_{uuid.uuid4().hex}", (Event,), {})
+                    self._interface = type(
+                        f"Event_{next(_event_counter)}", (Event,), {"__slots__": ()}
+                    )
                     return
             else:
                 raise TypeError(
@@ -162,32 +223,35 @@ class Provider:
                 )
 
         # None interface is not allowed
-        if interface in {None, NoneType}:
+        if interface is None or interface is NoneType:
             raise TypeError(f"Missing `{self}` provider return annotation.")
 
         # Set the interface
         self._interface = interface
 
-    def _resolve_interface(self, interface: Any, signature: inspect.Signature) -> Any:
+    def _resolve_interface(self) -> Any:
         """Resolve the interface of the callable provider."""
-        interface = signature.return_annotation
+        interface = get_typed_return_annotation(self._call)
         if interface is inspect.Signature.empty:
             return None
-        return get_typed_annotation(
-            interface,
-            self._call_globals,
-            module=self._call_module,
-        )
+        return interface
 
-    def _detect_parameters(self, signature: inspect.Signature) -> None:
+    def _detect_parameters(self) -> None:
         """Detect the parameters of the callable provider."""
-        self._parameters = [
-            parameter.replace(
-                annotation=get_typed_annotation(
-                    parameter.annotation,
-                    self._call_globals,
-                    module=self._call_module,
+        parameters = get_typed_parameters(self._call)
+        for parameter in parameters:
+            if parameter.annotation is inspect.Parameter.empty:
+                raise TypeError(
+                    f"Missing provider `{self}` "
+                    f"dependency `{parameter.name}` annotation."
                 )
-            )
-            for parameter in signature.parameters.values()
-        ]
+        self._parameters = parameters
+        # Split once by how the arguments are passed to the callable
+        self._positional_parameters = tuple(
+            parameter for parameter in parameters if parameter.kind is _POSITIONAL_ONLY
+        )
+        self._keyword_parameters = tuple(
+            parameter
+            for parameter in parameters
+            if parameter.kind is not _POSITIONAL_ONLY
+        )
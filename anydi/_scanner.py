@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 import importlib
-import inspect
 import pkgutil
 from collections.abc import Iterable
-from dataclasses import dataclass
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
@@ -30,8 +28,7 @@ T = TypeVar("T")
 P = ParamSpec("P")
 
 
-@dataclass(frozen=True)
-class Dependency:
+class Dependency(NamedTuple):
     member: Any
     module: ModuleType
 
@@ -41,6 +38,8 @@ class Scanner:
     """A class for scanning packages or modules for decorated objects
     and injecting dependencies."""
 
+    __slots__ = ("container",)
+
     def __init__(self, container: Container) -> None:
         self.container = container
 
@@ -98,7 +97,8 @@ class Scanner:
         """Scan a module for decorated members."""
         dependencies: list[Dependency] = []
 
-        for _, member in inspect.getmembers(module):
+        # Read the module namespace directly, no need to sort like `getmembers`
+        for member in list(vars(module).values()):
             if getattr(member, "__module__", None) != module.__name__ or not callable(
                 member
             ):
@@ -129,7 +129,7 @@ class Scanner:
                     dependencies.append(
                         self._create_dependency(member=member, module=module)
                     )
-                    continue
+                    break
 
         return dependencies
 
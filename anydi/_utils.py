@@ -8,6 +8,7 @@ import importlib
 import inspect
 import re
 import sys
+import weakref
 from typing import Any, Callable, ForwardRef, TypeVar
 
 from typing_extensions import ParamSpec, get_args, get_origin
@@ -21,6 +22,35 @@ except ImportError:
 T = TypeVar("T")
 P = ParamSpec("P")
 
+_signature_cache: weakref.WeakKeyDictionary[Callable[..., Any], inspect.Signature] = (
+    weakref.WeakKeyDictionary()
+)
+_typed_parameters_cache: weakref.WeakKeyDictionary[
+    Callable[..., Any], tuple[inspect.Parameter, ...]
+] = weakref.WeakKeyDictionary()
+_typed_return_annotation_cache: weakref.WeakKeyDictionary[Callable[..., Any], Any] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def weak_cache_get(cache: weakref.WeakKeyDictionary[Any, T], key: Any) -> T | None:
+    """Get a value from a weak cache, or None if it is missing."""
+    try:
+        return cache[key]
+    except (KeyError, TypeError):
+        return None
+
+
+def weak_cache_set(
+    cache: weakref.WeakKeyDictionary[Any, T], key: Any, value: T
+) -> None:
+    """Store a value in a weak cache if the key supports it."""
+    try:
+        cache[key] = value
+    except TypeError:
+        # The key is not hashable or does not support weak references
+        pass
+
 
 def get_full_qualname(obj: Any) -> str:
     """Get the fully qualified name of an object."""
@@ -61,18 +91,55 @@ def get_typed_annotation(
     return annotation
 
 
-def get_typed_parameters(obj: Callable[..., Any]) -> list[inspect.Parameter]:
-    """Get the typed parameters of a callable object."""
+def get_signature(obj: Callable[..., Any]) -> inspect.Signature:
+    """Get the signature of a callable object.
+
+    The result is cached per callable.
+    """
+    signature = weak_cache_get(_signature_cache, obj)
+    if signature is None:
+        signature = inspect.signature(obj)
+        weak_cache_set(_signature_cache, obj, signature)
+    return signature
+
+
+def get_typed_parameters(obj: Callable[..., Any]) -> tuple[inspect.Parameter, ...]:
+    """Get the typed parameters of a callable object.
+
+    The result is cached per callable.
+    """
+    parameters = weak_cache_get(_typed_parameters_cache, obj)
+    if parameters is not None:
+        return parameters
     globalns = getattr(obj, "__globals__", {})
     module = getattr(obj, "__module__", None)
-    return [
+    parameters = tuple(
         parameter.replace(
             annotation=get_typed_annotation(
                 parameter.annotation, globalns, module=module
             )
         )
-        for parameter in inspect.signature(obj).parameters.values()
-    ]
+        for parameter in get_signature(obj).parameters.values()
+    )
+    weak_cache_set(_typed_parameters_cache, obj, parameters)
+    return parameters
+
+
+def get_typed_return_annotation(obj: Callable[..., Any]) -> Any:
+    """Get the typed return annotation of a callable object.
+
+    The result is cached per callable.
+    """
+    annotation = weak_cache_get(_typed_return_annotation_cache, obj)
+    if annotation is not None:
+        return annotation
+    annotation = get_typed_annotation(
+        get_signature(obj).return_annotation,
+        getattr(obj, "__globals__", {}),
+        module=getattr(obj, "__module__", None),
+    )
+    weak_cache_set(_typed_return_annotation_cache, obj, annotation)
+    return annotation
 
 
 async def run_async(
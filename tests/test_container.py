@@ -2,7 +2,7 @@ import sys
 import uuid
 from collections.abc import AsyncIterator, Iterator, Sequence
 from dataclasses import dataclass
-from typing import Annotated, Any, Union
+from typing import Annotated, Any, Optional, Union
 
 import pytest
 from typing_extensions import Self
@@ -403,6 +403,62 @@ def test_request_context(container: Container) -> None:
     assert events == ["dep1:before", "dep1:after"]
 
 
+def test_singleton_context_exit_stacks_created_upfront(container: Container) -> None:
+    context = container._singleton_context  # noqa
+
+    assert context._stack is not None  # noqa
+    assert context._async_stack is not None  # noqa
+
+
+def test_request_context_exit_stacks_created_on_demand(container: Container) -> None:
+    def resource() -> Iterator[int]:
+        yield 1
+
+    container.register(str, lambda: "test", scope="request")
+    container.register(int, resource, scope="request")
+
+    with container.request_context() as context:
+        assert container.resolve(str) == "test"
+        assert context._stack is None  # noqa
+
+        assert container.resolve(int) == 1
+        assert context._stack is not None  # noqa
+        assert context._async_stack is None  # noqa
+
+
+def test_request_context_as_decorator(container: Container) -> None:
+    events = []
+
+    def dep1() -> Iterator[str]:
+        events.append("dep1:before")
+        yield "test"
+        events.append("dep1:after")
+
+    container.register(str, dep1, scope="request")
+
+    @container.request_context()
+    def handler() -> str:
+        return container.resolve(str)
+
+    assert handler() == "test"
+    assert handler() == "test"
+    assert events == ["dep1:before", "dep1:after", "dep1:before", "dep1:after"]
+
+
+async def test_request_context_async_with_not_allowed(container: Container) -> None:
+    with pytest.raises(TypeError):
+        async with container.request_context():
+            pass
+
+
+def test_request_context_reset_on_error(container: Container) -> None:
+    with pytest.raises(ValueError), container.request_context():
+        raise ValueError
+
+    with pytest.raises(LookupError):
+        container._get_request_context()  # noqa
+
+
 # Asynchronous lifespan
 
 
@@ -441,6 +497,42 @@ async def test_arequest_context(container: Container) -> None:
     assert events == ["dep1:before", "dep1:after"]
 
 
+async def test_arequest_context_as_decorator(container: Container) -> None:
+    events = []
+
+    async def dep1() -> AsyncIterator[str]:
+        events.append("dep1:before")
+        yield "test"
+        events.append("dep1:after")
+
+    container.register(str, dep1, scope="request")
+
+    @container.arequest_context()
+    async def handler() -> str:
+        return await container.aresolve(str)
+
+    assert await handler() == "test"
+    assert await handler() == "test"
+    assert events == ["dep1:before", "dep1:after", "dep1:before", "dep1:after"]
+
+
+def test_arequest_context_sync_with_not_allowed(container: Container) -> None:
+    with pytest.raises(TypeError), container.arequest_context():
+        pass
+
+    with pytest.raises(LookupError):
+        container._get_request_context()  # noqa
+
+
+async def test_arequest_context_reset_on_error(container: Container) -> None:
+    with pytest.raises(ValueError):
+        async with container.arequest_context():
+            raise ValueError
+
+    with pytest.raises(LookupError):
+        container._get_request_context()  # noqa
+
+
 def test_reset_resolved_instances(container: Container) -> None:
     container.register(str, lambda: "test", scope="singleton")
     container.register(int, lambda: 1, scope="singleton")
@@ -468,6 +560,20 @@ def test_resolve_singleton_scoped(container: Container) -> None:
     assert container.resolve(str) == instance
 
 
+def test_resolve_singleton_scoped_none_instance(container: Container) -> None:
+    calls = []
+
+    def provider() -> Optional[str]:
+        calls.append(1)
+        return None
+
+    container.register(Optional[str], provider, scope="singleton")
+
+    assert container.resolve(Optional[str]) is None
+    assert container.resolve(Optional[str]) is None
+    assert calls == [1]
+
+
 def test_resolve_singleton_scoped_not_started(container: Container) -> None:
     @container.provider(scope="singleton")
     def message() -> Iterator[str]:
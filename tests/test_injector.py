@@ -110,6 +110,25 @@ def test_inject_auto_marker_call(container: Container) -> None:
     assert result == "test"
 
 
+def test_inject_method(container: Container) -> None:
+    @container.provider(scope="singleton")
+    def message() -> str:
+        return "test"
+
+    class Handler:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def handle(self, message: str = auto) -> str:
+            return f"{self.name}: {message}"
+
+    handler1 = Handler(name="handler1")
+    handler2 = Handler(name="handler2")
+
+    assert container.inject(handler1.handle)() == "handler1: test"
+    assert container.inject(handler2.handle)() == "handler2: test"
+
+
 def test_inject_class(container: Container) -> None:
     @container.provider(scope="singleton")
     def ident_provider() -> str:
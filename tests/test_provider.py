@@ -60,6 +60,32 @@ class TestProvider:
         assert provider.kind == kind
         assert provider.interface is interface
 
+    @pytest.mark.parametrize(
+        "call, is_coroutine, is_generator, is_async_generator, is_resource",
+        [
+            (func, False, False, False, False),
+            (Class, False, False, False, False),
+            (generator, False, True, False, True),
+            (async_generator, False, False, True, True),
+            (coro, True, False, False, False),
+        ],
+    )
+    def test_kind_flags(
+        self,
+        call: Callable[..., Any],
+        is_coroutine: bool,
+        is_generator: bool,
+        is_async_generator: bool,
+        is_resource: bool,
+    ) -> None:
+        provider = Provider(call=call, scope="singleton")
+
+        assert provider.is_coroutine is is_coroutine
+        assert provider.is_generator is is_generator
+        assert provider.is_async_generator is is_async_generator
+        assert provider.is_resource is is_resource
+        assert not provider.is_event
+
     @pytest.mark.parametrize(
         "annotation, expected",
         [
@@ -99,6 +125,7 @@ class TestProvider:
 
         assert provider.kind == kind
         assert issubclass(provider.interface, Event)
+        assert provider.is_event
 
     def test_construct_with_interface(self) -> None:
         provider = Provider(call=lambda: "hello", scope="singleton", interface=str)
@@ -150,3 +177,46 @@ class TestProvider:
             "The resource provider `tests.test_provider.generator` is attempting to "
             "register with a transient scope, which is not allowed."
         )
+
+    def test_construct_missing_parameter_annotation(self) -> None:
+        def call(ident) -> str:  # type: ignore[no-untyped-def]
+            return str(ident)
+
+        with pytest.raises(TypeError) as exc_info:
+            Provider(call=call, scope="singleton")
+
+        assert str(exc_info.value) == (
+            "Missing provider `tests.test_provider.TestProvider."
+            "test_construct_missing_parameter_annotation.<locals>.call` "
+            "dependency `ident` annotation."
+        )
+
+    def test_resource_factory(self) -> None:
+        provider = Provider(call=generator, scope="singleton")
+
+        assert provider.resource_factory is not None
+        with provider.resource_factory() as value:
+            assert value == "generator"
+
+    def test_resource_factory_not_resource(self) -> None:
+        provider = Provider(call=func, scope="singleton")
+
+        assert provider.resource_factory is None
+
+    def test_positional_and_keyword_parameters(self) -> None:
+        def call(a: int, /, b: str, *, c: float) -> Service:
+            return Service(ident=f"{a}{b}{c}")
+
+        provider = Provider(call=call, scope="singleton")
+
+        assert [p.name for p in provider.positional_parameters] == ["a"]
+        assert [p.name for p in provider.keyword_parameters] == ["b", "c"]
+
+    def test_parameters_immutable(self) -> None:
+        def call(a: int, b: str) -> Service:
+            return Service(ident=f"{a}{b}")
+
+        provider = Provider(call=call, scope="singleton")
+
+        assert isinstance(provider.parameters, tuple)
+        assert Provider(call=call, scope="singleton").parameters == provider.parameters
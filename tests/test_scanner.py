@@ -1,7 +1,9 @@
+from types import ModuleType
+
 import pytest
 
-from anydi import Container, injectable
-from anydi._scanner import InjectDecoratorArgs  # noqa
+from anydi import Container, auto, injectable
+from anydi._scanner import InjectDecoratorArgs, Scanner  # noqa
 
 from .scan_app import ScanAppModule
 
@@ -45,6 +47,20 @@ def test_scan_tagged(container: Container) -> None:
     assert a_a3_handler_1() == "a.a1.str_provider"
 
 
+def test_scan_module_multiple_markers(container: Container) -> None:
+    module = ModuleType("tests.scan_multiple_markers")
+
+    def handler(a: int = auto, b: str = auto) -> None:
+        pass
+
+    handler.__module__ = module.__name__
+    module.handler = handler  # type: ignore[attr-defined]
+
+    dependencies = Scanner(container)._scan_module(module, tags=[])  # noqa
+
+    assert [dependency.member for dependency in dependencies] == [handler]
+
+
 def test_inject_decorator_no_args() -> None:
     @injectable
     def my_func() -> None:
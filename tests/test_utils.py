@@ -1,10 +1,20 @@
 import sys
+import weakref
 from typing import Annotated, Any, Union
 
 import pytest
 
 from anydi import Container
-from anydi._utils import get_full_qualname, import_string, is_builtin_type
+from anydi._utils import (
+    get_full_qualname,
+    get_signature,
+    get_typed_parameters,
+    get_typed_return_annotation,
+    import_string,
+    is_builtin_type,
+    weak_cache_get,
+    weak_cache_set,
+)
 
 from tests.fixtures import Service
 
@@ -62,6 +72,57 @@ def test_get_full_qualname(obj: Any, expected_qualname: str) -> None:
     assert qualname == expected_qualname
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires Python 3.10")
+def test_get_full_qualname_equal_objects() -> None:
+    assert get_full_qualname(Union[int, str]) == "Union[int, str]"
+    assert get_full_qualname(Union[str, int]) == "Union[str, int]"
+
+
+def test_weak_cache() -> None:
+    cache: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+
+    weak_cache_set(cache, Service, "service")
+    weak_cache_set(cache, 1, "one")
+
+    assert weak_cache_get(cache, Service) == "service"
+    assert weak_cache_get(cache, 1) is None
+    assert weak_cache_get(cache, []) is None
+
+
+def test_get_signature() -> None:
+    def func(a: int) -> str:
+        return str(a)
+
+    signature = get_signature(func)
+
+    assert list(signature.parameters) == ["a"]
+    assert get_signature(func) is signature
+
+
+def test_get_typed_parameters() -> None:
+    def func(a: "int", b: Service) -> None:
+        pass
+
+    parameters = get_typed_parameters(func)
+
+    assert [(p.name, p.annotation) for p in parameters] == [("a", int), ("b", Service)]
+    assert isinstance(parameters, tuple)
+    assert get_typed_parameters(func) is parameters
+
+
+def test_get_typed_parameters_not_weakrefable() -> None:
+    parameters = get_typed_parameters(divmod)
+
+    assert [p.name for p in parameters] == ["x", "y"]
+
+
+def test_get_typed_return_annotation() -> None:
+    def func() -> "Service":
+        return Service(ident="test")
+
+    assert get_typed_return_annotation(func) is Service
+
+
 def test_import_string() -> None:
     assert import_string("anydi.Container") is Container
 